@@ -2,7 +2,7 @@ from datetime import time
 from pathlib import Path
 from precise_patterns.aggregator import MinuteAggregator
 from precise_patterns.dtypes import Candle, Pivot
-from precise_patterns.events import event_bus
+from precise_patterns.events import bind, event_bus
 from precise_patterns.pivots import PivotDetector
 from precise_patterns.readers.csv import CSVReader
 from precise_patterns.storage.csv import CSVStorage
@@ -40,7 +40,10 @@ event_bus.add_listener("candle.close", pivots.on_candle_close)
 event_bus.add_listener("candle.close", storage.on_candle)
 event_bus.add_listener("pivot.confirm", on_pivot_confirm)
 
-for row in reader.stream("ashokley"):
-    agg.on_candle_close("ashokley", *row.values())
+# Bind candle.close listeners to skip the event_bus lookup per candle
+agg.listeners = bind("candle.close")
+
+for batch in reader.stream_batches("ashokley", as_tuple=True):
+    agg.on_rows("ashokley", batch)
 
 storage.save()
@@ -1,4 +1,4 @@
-from .base.aggregator import BaseAggregator
+from .base.aggregator import BaseAggregator, Listeners
 from datetime import datetime, time, date, timedelta
 from .dtypes import OHLC, Candle, EODTimeframes
 from typing import List, Dict, Set
@@ -6,6 +6,24 @@ from .events import event_bus
 from math import inf
 
 
+def emit_candle(listeners: Listeners | None, candle: Candle) -> None:
+    """
+    Dispatch a closed candle to ``"candle.close"`` listeners.
+
+    :param listeners: Listeners bound with :func:`~precise_patterns.events.bind`.
+                      If ``None``, the candle is emitted via the ``event_bus``.
+    :type listeners: :class:`tuple` of callables or ``None``
+    :param candle: The closed candle
+    :type candle: :class:`~precise_patterns.dtypes.Candle`
+    """
+    if listeners is None:
+        event_bus.emit("candle.close", candle)
+        return
+
+    for fn in listeners:
+        fn(candle)
+
+
 class CandleBuilder:
     """
     Builds and updates OHLC candle data.
@@ -269,8 +287,8 @@ class EODAggregator(BaseAggregator):
         .. note::
            Uses ``"candle.close"`` event channel.
         """
-        event_bus.emit(
-            "candle.close",
+        emit_candle(
+            self.listeners,
             Candle(
                 symbol=symbol,
                 timeframe=tf,
@@ -304,8 +322,8 @@ class EODAggregator(BaseAggregator):
         :type v: :class:`float`
         """
         if "D" in self.filter_timeframes:
-            event_bus.emit(
-                "candle.close",
+            emit_candle(
+                self.listeners,
                 Candle(
                     symbol=symbol,
                     timeframe="D",
@@ -434,6 +452,10 @@ class MinuteAggregator(BaseAggregator):
             else set([3, 5, 15, 25, 30, 60, 75, 120, 125, 240])
         )
 
+        # Timeframes aggregated from 1-minute candles, resolved once
+        # instead of filtering out the 1-minute timeframe on every candle.
+        self._timeframes = tuple(tf for tf in self.filter_timeframes if tf != 1)
+
         self.start_time = start_time
 
         self.end_time = (
@@ -454,8 +476,8 @@ class MinuteAggregator(BaseAggregator):
         :param tf: Minute timeframe value (e.g. 5, 15, 30)
         :type tf: :class:`int`
         """
-        event_bus.emit(
-            "candle.close",
+        emit_candle(
+            self.listeners,
             Candle(
                 symbol=symbol,
                 timeframe=tf,
@@ -498,8 +520,8 @@ class MinuteAggregator(BaseAggregator):
            Directly emits 1-minute candles if timeframe ``1`` enabled.
         """
         if 1 in self.filter_timeframes:
-            event_bus.emit(
-                "candle.close",
+            emit_candle(
+                self.listeners,
                 Candle(
                     symbol=symbol,
                     timeframe=1,
@@ -520,9 +542,7 @@ class MinuteAggregator(BaseAggregator):
             self.start_date = datetime.combine(ts, self.start_time)
             self.end_date = datetime.combine(ts, self.end_time)
 
-            for tf in self.filter_timeframes:
-                if tf == 1:
-                    continue
+            for tf in self._timeframes:
                 self.emit_event(symbol, tf)
                 self.data[symbol][tf].reset(ts)
 
@@ -534,24 +554,28 @@ class MinuteAggregator(BaseAggregator):
         if is_session_end:
             self.start_date = self.end_date = None
 
-        for tf in self.filter_timeframes:
-            if tf == 1:
-                continue
+        if not self._timeframes:
+            return
+
+        builders = self.data.get(symbol)
+
+        if builders is None:
+            builders = self.data[symbol] = {}
+
+        for tf in self._timeframes:
+            builder = builders.get(tf)
 
             if minutes_elapsed and minutes_elapsed % tf == 0:
                 self.emit_event(symbol, tf)
-                self.data[symbol][tf].reset(ts)
-
-            if symbol not in self.data:
-                self.data[symbol] = {}
+                builders[tf].reset(ts)
 
-            if tf in self.data[symbol]:
-                self.data[symbol][tf].update(o, h, l, c, v)
+            if builder is None:
+                builder = builders[tf] = CandleBuilder(ts, o, h, l, c, v)
             else:
-                self.data[symbol][tf] = CandleBuilder(ts, o, h, l, c, v)
+                builder.update(o, h, l, c, v)
 
             if is_session_start:
-                self.data[symbol][tf].reset(ts)
+                builder.reset(ts)
 
             if is_session_end:
                 self.emit_event(symbol, tf)
@@ -1,5 +1,10 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
+from typing import Any, Callable, Iterable, Optional, Tuple
+from ..dtypes import OHLC, OHLCRow, Candle
+
+Listeners = Tuple[Callable[[Candle], Any], ...]
+"""A tuple of ``"candle.close"`` listeners, as returned by :func:`~precise_patterns.events.bind`."""
 
 
 class BaseAggregator(ABC):
@@ -12,14 +17,25 @@ class BaseAggregator(ABC):
     :raises NotImplementedError: When subclass does not override
                                  :func:`on_candle_close`
 
+    :ivar listeners: Pre-bound ``"candle.close"`` listeners. When set, closed
+                     candles are passed directly to each listener instead of
+                     being emitted via the ``event_bus``. Defaults to ``None``
+    :vartype listeners: :data:`Listeners` or ``None``
+
     .. note::
        Aggregators emit events to the global ``event_bus`` under the
        channel ``"candle.close"``.
 
+    .. warning::
+       ``listeners`` is a snapshot. Listeners added to the ``event_bus`` after
+       binding are not called until ``listeners`` is bound again.
+
     .. seealso:: :class:`EODAggregator`, :class:`MinuteAggregator`
 
     """
 
+    listeners: Optional[Listeners] = None
+
     @abstractmethod
     def on_candle_close(
         self,
@@ -33,3 +49,49 @@ class BaseAggregator(ABC):
     ) -> None:
         """Resample the candle to various EOD or minute timeframes"""
         pass
+
+    def on_batch(self, symbol: str, candles: Iterable[OHLC]) -> None:
+        """
+        Process a sequence of closed candles for a single symbol.
+
+        Equivalent to calling :meth:`on_candle_close` for each candle, in order,
+        but resolves the method once for the entire batch.
+
+        :param symbol: Market symbol
+        :type symbol: :class:`str`
+        :param candles: Candles sorted in ascending order of timestamp. For example,
+                        the output of :meth:`~precise_patterns.readers.csv.CSVReader.stream`
+        :type candles: :class:`~typing.Iterable`\\[:class:`~precise_patterns.dtypes.OHLC`]
+        """
+        on_candle_close = self.on_candle_close
+
+        for c in candles:
+            on_candle_close(
+                symbol,
+                c["timestamp"],
+                c["open"],
+                c["high"],
+                c["low"],
+                c["close"],
+                c["volume"],
+            )
+
+    def on_rows(self, symbol: str, rows: Iterable[OHLCRow]) -> None:
+        """
+        Process a sequence of closed candles given as tuples.
+
+        Same as :meth:`on_batch`, but each candle is a
+        :data:`~precise_patterns.dtypes.OHLCRow` tuple, which is unpacked
+        directly instead of looking up each field in a dict.
+
+        :param symbol: Market symbol
+        :type symbol: :class:`str`
+        :param rows: Candles sorted in ascending order of timestamp. For example,
+                     the output of :meth:`~precise_patterns.readers.csv.CSVReader.stream`
+                     with ``as_tuple=True``
+        :type rows: :class:`~typing.Iterable`\\[:data:`~precise_patterns.dtypes.OHLCRow`]
+        """
+        on_candle_close = self.on_candle_close
+
+        for ts, o, h, l, c, v in rows:
+            on_candle_close(symbol, ts, o, h, l, c, v)
@@ -1,106 +1,165 @@
-from abc import ABC, abstractmethod
-from typing import ClassVar, Dict
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, Hashable, Tuple, Type, TypeVar
 from ..dtypes import Candle, Pivot
+from . import registry
+from .registry import Registry
 
 
-class BasePattern(ABC):
+class BasePattern:
     """
     Base class for all patterns.
 
-    This abstract base class defines the minimal interface required for a
-    pattern that can be registered in :class:`Registry`. Subclasses must
+    This base class defines the minimal interface required for a
+    pattern that can be registered in :class:`~.Registry`. Subclasses must
     define a non-empty class attribute ``name`` and implement
     :meth:`on_pivot`.
 
+    This is a plain class rather than an :class:`abc.ABC`, so instantiating
+    a pattern avoids the :class:`abc.ABCMeta` checks. Instead,
+    :func:`register_pattern` checks that :meth:`on_pivot` is overridden when
+    the subclass is registered.
+
     :param name: Class-level identifier for the pattern subclass.
     :type name: :class:`str` or ``None``
+    :param cache_size: Maximum number of results cached by :meth:`classify`.
+    :type cache_size: :class:`int`
+
+    .. note::
+       Subclasses are automatically registered in :class:`~.Registry`
+       upon creation via ``__init_subclass__``. Alternatively, register
+       explicitly with the :func:`register_pattern` decorator:
+
+       .. code-block:: python
+
+           @register_pattern
+           class DoubleTop(BasePattern, register=False):
+               name = "DoubleTop"
 
     .. note::
-       Subclasses are automatically registered in :class:`Registry`
-       upon creation via ``__init_subclass__``.
+       If a subclass defines :meth:`classify` as a :class:`staticmethod`, it is
+       wrapped in :func:`functools.lru_cache` on class creation, whether or not
+       the subclass is registered. Repeated pivot windows then return the
+       cached result instead of being recomputed.
     """
 
     name: ClassVar[str | None] = None
+    cache_size: ClassVar[int] = 4096
 
-    def __init_subclass__(cls, **kwargs):
+    def __init_subclass__(cls, register: bool = True, **kwargs):
         """
         Automatically validates and registers subclasses.
 
-        This method ensures that every subclass of :class:`BasePattern`
-        defines a valid ``name`` attribute and that the name is unique
-        within the global :class:`Registry`.
+        A :meth:`classify` defined by the subclass is wrapped in
+        :func:`functools.lru_cache`. Registration is delegated to
+        :func:`register_pattern`. Pass ``register=False`` in the class
+        definition to skip it, for example when registering explicitly with
+        the :func:`register_pattern` decorator.
 
-        :raises ValueError: If ``name`` is missing, empty, non-string, or
-                            duplicates an existing registered pattern.
+        :param register: Whether to validate and register the subclass.
+        :type register: :class:`bool`
+        :raises TypeError: If ``classify`` is defined but is not a
+                           :class:`staticmethod`.
 
         .. seealso::
-           :class:`Registry`
+           :func:`register_pattern`
+           :class:`~.Registry`
         """
         super().__init_subclass__(**kwargs)
 
-        if cls.name is None:
-            raise ValueError(
-                f"`name` attribute must be set on subclass `{cls.__name__}`"
-            )
+        classify = cls.__dict__.get("classify")
+
+        if classify is not None:
+            if not isinstance(classify, staticmethod):
+                raise TypeError(
+                    f"`classify` of `{cls.__name__}`, must be a staticmethod"
+                )
 
-        if not isinstance(cls.name, str) or not cls.name:
-            raise ValueError(
-                f"`name` attribute of `{cls.__name__}`, must be a non-empty string"
+            cls.classify = staticmethod(  # type: ignore[method-assign]
+                lru_cache(maxsize=cls.cache_size)(classify.__func__)
             )
 
-        Registry.register(cls)
+        if register:
+            register_pattern(cls)
 
-    @abstractmethod
-    def on_pivot(self, pivot: Pivot, candle: Candle):
+    @staticmethod
+    def classify(window: Tuple[Hashable, ...]) -> Any:
         """
-        Execute logic when a pivot event occurs.
+        Classify a window of recent pivots.
 
-        This method must be implemented by subclasses to define the behavior
-        triggered when a pivot event is detected.
+        Subclasses may override this as a :class:`staticmethod`. The result
+        must depend only on ``window``, as results are cached by window.
 
+        :param window: Hashable summary of the recent pivots, for example a
+                       tuple of ``(price, type)`` pairs.
+        :type window: :class:`tuple`
         :raises NotImplementedError: Always, unless implemented by subclass.
         """
+        raise NotImplementedError
 
+    @classmethod
+    def cache_clear(cls) -> None:
+        """
+        Clear cached :meth:`classify` results for this pattern class.
 
-class Registry:
-    """
-    Registry for managing pattern classes.
-
-    This class stores registered subclasses of :class:`BasePattern`.
-    """
+        Use when previously classified windows are no longer valid.
+        """
+        cache_clear = getattr(cls.classify, "cache_clear", None)
 
-    _register: Dict[str, type] = {}
+        if cache_clear:
+            cache_clear()
 
-    @classmethod
-    def register(cls, subcls: type):
+    def on_pivot(self, pivot: Pivot, candle: Candle):
         """
-        Register a :class:`BasePattern` subclass.
+        Execute logic when a pivot event occurs.
 
-        :param subcls: The subclass to register.
-        :type subcls: :class:`type`
-        :raises ValueError: If a pattern with the same ``name`` is already registered.
+        This method must be implemented by subclasses to define the behavior
+        triggered when a pivot event is detected.
 
-        .. note::
-           The subclass must define a unique ``name`` before registration.
+        :raises NotImplementedError: Always, unless implemented by subclass.
         """
-        name = subcls.name
+        raise NotImplementedError
 
-        if name in cls._register:
-            existing = cls._register[name].__name__
-            current = subcls.__name__
 
-            raise ValueError(
-                f"Duplicate name assigned for classes `{current}` and `{existing}`"
-            )
+P = TypeVar("P", bound=BasePattern)
 
-        cls._register[subcls.name] = subcls
 
-    @classmethod
-    def all(cls):
-        """
-        Return all registered pattern classes.
+def register_pattern(cls: Type[P]) -> Type[P]:
+    """
+    Validate and register a :class:`BasePattern` subclass.
+
+    Ensures the subclass defines a valid ``name`` attribute, overrides
+    :meth:`~BasePattern.on_pivot`, and that the name is unique within the
+    global :class:`~.Registry`. Classes already registered are returned
+    unchanged.
+
+    :param cls: The subclass to register.
+    :type cls: :class:`type`\\[:class:`BasePattern`]
+    :return: The registered class, allowing use as a class decorator.
+    :rtype: :class:`type`\\[:class:`BasePattern`]
+    :raises ValueError: If ``name`` is missing, empty, non-string, or
+                        duplicates an existing registered pattern.
+    :raises TypeError: If ``on_pivot`` is not overridden.
+
+    .. seealso::
+       :class:`~.Registry`
+    """
+    # Check the class dict, as subclasses inherit the flag
+    if cls.__dict__.get("_registered", False):
+        return cls
 
-        :return: A mapping of all registered pattern names to their classes.
-        :rtype: :class:`dict` [:class:`str`, :class:`type`]
-        """
-        return cls._register
+    name = cls.name
+
+    if name is None:
+        raise ValueError(f"`name` attribute must be set on subclass `{cls.__name__}`")
+
+    if not isinstance(name, str) or not name:
+        raise ValueError(
+            f"`name` attribute of `{cls.__name__}`, must be a non-empty string"
+        )
+
+    if cls.on_pivot is BasePattern.on_pivot:
+        raise TypeError(f"`{cls.__name__}` must override `on_pivot`")
+
+    registry.register(cls, name)
+    cls._registered = True
+    return cls
@@ -0,0 +1,105 @@
+"""
+Module-level registry of pattern classes.
+
+Pattern classes are registered automatically when subclassing
+:class:`~precise_patterns.base.pattern.BasePattern`. Registered classes and
+instances are stored in plain module-level dicts.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Dict, Type
+
+if TYPE_CHECKING:
+    from .pattern import BasePattern
+
+_REGISTER: Dict[str, Type[BasePattern]] = {}
+_INSTANCES: Dict[str, BasePattern] = {}
+
+
+def register(subcls: Type[BasePattern], name: str | None = None) -> None:
+    """
+    Register a :class:`~precise_patterns.base.pattern.BasePattern` subclass.
+
+    :param subcls: The subclass to register.
+    :type subcls: :class:`type`
+    :param name: The validated ``name`` of the subclass. If ``None``, it is
+                 read from ``subcls.name``.
+    :type name: :class:`str` or ``None``
+    :raises ValueError: If a pattern with the same ``name`` is already registered.
+
+    .. note::
+       The subclass must define a unique ``name`` before registration.
+    """
+    if name is None:
+        name = subcls.name
+
+    existing = _REGISTER.setdefault(name, subcls)
+
+    if existing is not subcls:
+        raise ValueError(
+            f"Duplicate name assigned for classes `{subcls.__name__}` and `{existing.__name__}`"
+        )
+
+
+def create(name: str, **kwargs: Any) -> BasePattern:
+    """
+    Return the shared instance of the pattern registered as ``name``.
+
+    The instance is created with ``kwargs`` on first call. Subsequent calls
+    return the same instance and ``kwargs`` are ignored.
+
+    .. note::
+       This keeps one instance per pattern name, for patterns that track all
+       symbols and timeframes themselves.
+       :class:`~precise_patterns.patterns.PatternManager` does not use it. It
+       creates a separate instance per symbol and timeframe.
+
+    :param name: Registered pattern name.
+    :type name: :class:`str`
+    :return: The pattern instance.
+    :rtype: :class:`~precise_patterns.base.pattern.BasePattern`
+    :raises KeyError: If no pattern is registered as ``name``.
+    """
+    try:
+        return _INSTANCES[name]
+    except KeyError:
+        instance = _INSTANCES[name] = _REGISTER[name](**kwargs)
+        return instance
+
+
+def get_instance(name: str) -> BasePattern:
+    """
+    Return the instance previously created by :func:`create`.
+
+    :param name: Registered pattern name.
+    :type name: :class:`str`
+    :return: The pattern instance.
+    :rtype: :class:`~precise_patterns.base.pattern.BasePattern`
+    :raises KeyError: If no instance was created for ``name``.
+    """
+    return _INSTANCES[name]
+
+
+def registered() -> Dict[str, Type[BasePattern]]:
+    """
+    Return all registered pattern classes.
+
+    :return: A mapping of all registered pattern names to their classes.
+    :rtype: :class:`dict` [:class:`str`, :class:`type`]
+    """
+    return _REGISTER
+
+
+class Registry:
+    """
+    Registry for managing pattern classes.
+
+    Kept for backward compatibility. Each method forwards to the module-level
+    function of the same name, except ``Registry.all``, which forwards to
+    :func:`registered`.
+    """
+
+    register = staticmethod(register)
+    create = staticmethod(create)
+    get_instance = staticmethod(get_instance)
+    all = staticmethod(registered)
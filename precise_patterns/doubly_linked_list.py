@@ -1,8 +1,11 @@
 from __future__ import annotations
-from typing import Generic, Iterator, Optional, TypeVar
+from typing import ClassVar, Generic, Iterator, List, Optional, TypeVar
 
 T = TypeVar("T")
 
+POOL_SIZE = 4096
+"""Maximum number of removed nodes kept for reuse by :class:`DoublyLinkedList`."""
+
 
 class Node(Generic[T]):
     """
@@ -67,10 +70,22 @@ class DoublyLinkedList(Generic[T]):
        :type: int
 
        Number of elements in the list.
+
+    .. attribute:: _pool
+       :type: List[:class:`Node`]
+
+       Class-level freelist of removed nodes, shared by all lists. New nodes
+       are taken from the pool when available, avoiding a fresh allocation.
+
+    .. warning::
+       Nodes removed from the list are recycled. Do not hold a reference to a
+       node after it has been removed.
     """
 
     __slots__ = ("_head", "_tail", "_size")
 
+    _pool: ClassVar[List[Node]] = []
+
     def __init__(self) -> None:
         """
         Initialize an empty list.
@@ -91,6 +106,34 @@ class DoublyLinkedList(Generic[T]):
         """
         return self._size
 
+    @classmethod
+    def _acquire(
+        cls,
+        value: T,
+        prev: Optional[Node[T]] = None,
+        next: Optional[Node[T]] = None,
+    ) -> Node[T]:
+        """
+        Return a node from the pool, or a new node if the pool is empty.
+
+        :param value: Value to store in the node.
+        :type value: T
+        :param prev: Previous node.
+        :type prev: Optional[:class:`Node`]
+        :param next: Next node.
+        :type next: Optional[:class:`Node`]
+        :returns: The initialized node.
+        :rtype: :class:`Node`
+        """
+        if not cls._pool:
+            return Node(value, prev, next)
+
+        node = cls._pool.pop()
+        node.value = value
+        node.prev = prev
+        node.next = next
+        return node
+
     def __iter__(self) -> Iterator[T]:
         """
         Iterate over the list from head to tail.
@@ -98,10 +141,10 @@ class DoublyLinkedList(Generic[T]):
         :returns: An iterator over stored values.
         :rtype: Iterator[T]
         """
-        current = self._head
-        while current:
-            yield current.value
-            current = current.next
+        node = self._head
+        while node is not None:
+            yield node.value
+            node = node.next
 
     def __reversed__(self) -> Iterator[T]:
         """
@@ -110,10 +153,71 @@ class DoublyLinkedList(Generic[T]):
         :returns: A reverse iterator over stored values.
         :rtype: Iterator[T]
         """
-        current = self._tail
-        while current:
-            yield current.value
-            current = current.prev
+        node = self._tail
+        while node is not None:
+            yield node.value
+            node = node.prev
+
+    def iter_from(
+        self, node: Node[T], forward: bool = True, limit: Optional[int] = None
+    ) -> Iterator[T]:
+        """
+        Iterate over values starting at ``node``, without walking from the
+        head or tail.
+
+        :param node: Node to start from. Its value is yielded first.
+        :type node: :class:`Node`
+        :param forward: If ``True``, iterate towards the tail, else towards
+                        the head.
+        :type forward: bool
+        :param limit: Maximum number of values to yield. If ``None``, iterate
+                      to the end of the list.
+        :type limit: Optional[int]
+        :returns: An iterator over at most ``limit`` values.
+        :rtype: Iterator[T]
+
+        .. code-block:: python
+
+            node = dll.append(pivot)
+
+            # Last 5 values, most recent first
+            for value in dll.iter_from(node, forward=False, limit=5):
+                ...
+        """
+        remaining = self._size if limit is None else limit
+        current: Optional[Node[T]] = node
+
+        if forward:
+            while current is not None and remaining > 0:
+                yield current.value
+                current = current.next
+                remaining -= 1
+        else:
+            while current is not None and remaining > 0:
+                yield current.value
+                current = current.prev
+                remaining -= 1
+
+    def values_list(self) -> List[T]:
+        """
+        Return the values from head to tail as a list.
+
+        Faster than ``list(dll)``, as it fills a preallocated list without
+        going through the iterator protocol.
+
+        :returns: A list of stored values.
+        :rtype: List[T]
+        """
+        result: List = [None] * self._size
+        node = self._head
+        i = 0
+
+        while node is not None:
+            result[i] = node.value
+            node = node.next
+            i += 1
+
+        return result
 
     def append(self, value: T) -> Node[T]:
         """
@@ -124,7 +228,7 @@ class DoublyLinkedList(Generic[T]):
         :returns: The newly created node.
         :rtype: :class:`Node`
         """
-        node = Node(value, prev=self._tail)
+        node = self._acquire(value, prev=self._tail)
 
         if self._tail:
             self._tail.next = node
@@ -144,7 +248,7 @@ class DoublyLinkedList(Generic[T]):
         :returns: The newly created node.
         :rtype: :class:`Node`
         """
-        node = Node(value, next=self._head)
+        node = self._acquire(value, next=self._head)
 
         if self._head:
             self._head.prev = node
@@ -196,7 +300,7 @@ class DoublyLinkedList(Generic[T]):
         :returns: The newly created node.
         :rtype: :class:`Node`
         """
-        new_node = Node(value, prev=node, next=node.next)
+        new_node = self._acquire(value, prev=node, next=node.next)
 
         if node.next:
             node.next.prev = new_node
@@ -218,7 +322,7 @@ class DoublyLinkedList(Generic[T]):
         :returns: The newly created node.
         :rtype: :class:`Node`
         """
-        new_node = Node(value, prev=node.prev, next=node)
+        new_node = self._acquire(value, prev=node.prev, next=node)
 
         if node.prev:
             node.prev.next = new_node
@@ -233,6 +337,8 @@ class DoublyLinkedList(Generic[T]):
         """
         Remove a node from the list.
 
+        The node is returned to the pool for reuse, unless the pool is full.
+
         :param node: Node to remove.
         :type node: :class:`Node`
         :returns: ``None``
@@ -248,10 +354,14 @@ class DoublyLinkedList(Generic[T]):
         else:
             self._tail = node.prev
 
+        node.value = None  # type: ignore[assignment]
         node.prev = None
         node.next = None
         self._size -= 1
 
+        if len(self._pool) < POOL_SIZE:
+            self._pool.append(node)
+
     def clear(self) -> None:
         """
         Remove all elements from the list.
@@ -1,4 +1,4 @@
-from typing import Literal, TypedDict
+from typing import Literal, Tuple, TypedDict
 from datetime import datetime
 
 
@@ -33,6 +33,15 @@ class OHLC(TypedDict):
     volume: float
 
 
+OHLCRow = Tuple[datetime, float, float, float, float, float]
+"""A single OHLCV candle as a plain tuple.
+
+Fields are in the same order as :class:`OHLC`:
+``(timestamp, open, high, low, close, volume)``. Used where building a dict
+per candle is unnecessary overhead.
+"""
+
+
 EODTimeframes = Literal["D", "W", "M", "Q"]
 """Valid end-of-day timeframe identifiers.
 
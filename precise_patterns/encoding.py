@@ -0,0 +1,65 @@
+"""
+Encoding of pivot fields into numbers, for storage in :class:`array.array`
+columns.
+
+Used by :class:`~precise_patterns.ring_buffer.RingBuffer` and
+:class:`~precise_patterns.pivot_table.PivotTable`.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, Literal
+
+EPOCH = datetime(1970, 1, 1)
+"""Reference time for encoded timestamps."""
+
+MICROSECOND = timedelta(microseconds=1)
+
+PIVOT_KIND: Dict[str, int] = {"high": 1, "low": -1}
+"""Encoding of the pivot type. ``0`` is never used, so it may mark an empty slot."""
+
+PIVOT_TYPE: Dict[int, Literal["high", "low"]] = {1: "high", -1: "low"}
+"""Decoding of the pivot type. Inverse of :data:`PIVOT_KIND`."""
+
+
+def epoch_for(ts: datetime) -> datetime:
+    """
+    Return the epoch used to encode timestamps like ``ts``.
+
+    For a timezone-aware ``ts``, this is :data:`EPOCH` with the same
+    ``tzinfo``, so encoded timestamps decode back with that ``tzinfo``.
+
+    :param ts: A timestamp to be encoded.
+    :type ts: :class:`~datetime.datetime`
+    :returns: :data:`EPOCH`, with ``tzinfo`` set if ``ts`` is aware.
+    :rtype: :class:`~datetime.datetime`
+    """
+    return EPOCH if ts.tzinfo is None else EPOCH.replace(tzinfo=ts.tzinfo)
+
+
+def encode_timestamp(ts: datetime, epoch: datetime = EPOCH) -> int:
+    """
+    Encode a timestamp as microseconds since ``epoch``.
+
+    :param ts: Timestamp to encode.
+    :type ts: :class:`~datetime.datetime`
+    :param epoch: Epoch returned by :func:`epoch_for`. Must be naive if
+                  ``ts`` is naive, and aware if ``ts`` is aware.
+    :type epoch: :class:`~datetime.datetime`
+    :returns: Microseconds since ``epoch``.
+    :rtype: int
+    """
+    return (ts - epoch) // MICROSECOND
+
+
+def decode_timestamp(us: int, epoch: datetime = EPOCH) -> datetime:
+    """
+    Decode a timestamp encoded by :func:`encode_timestamp`.
+
+    :param us: Microseconds since ``epoch``.
+    :type us: int
+    :param epoch: Epoch used to encode the timestamp.
+    :type epoch: :class:`~datetime.datetime`
+    :returns: The timestamp, with the ``tzinfo`` of ``epoch``.
+    :rtype: :class:`~datetime.datetime`
+    """
+    return epoch + timedelta(microseconds=us)
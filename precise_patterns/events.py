@@ -1,10 +1,130 @@
+from typing import Any, Callable, Dict, Optional, Tuple
 from pyee.base import EventEmitter
 
 """
 This module provides a shared application-wide event emitter.
 
-It exposes a single :class:`pyee.base.EventEmitter` instance
+It exposes a single :class:`EventBus` instance
 named :data:`event_bus`, which can be used to register and emit events
 throughout the application.
 """
-event_bus = EventEmitter()
+
+
+class EventBus(EventEmitter):
+    """
+    A :class:`pyee.base.EventEmitter` that keeps an immutable snapshot of
+    the handlers for each event.
+
+    The snapshot is rebuilt whenever a listener is added or removed
+    (copy-on-write). Emitting an event iterates the snapshot directly instead
+    of copying the handlers into a new list under a lock on every emit.
+
+    .. note::
+       A listener added or removed while an event is being emitted takes
+       effect from the next emit.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._snapshots: Dict[str, Tuple[Callable[..., Any], ...]] = {}
+
+    def _update_snapshot(self, event: str) -> None:
+        # Must be called with self._lock held
+        handlers = self._events.get(event)
+
+        if handlers:
+            self._snapshots[event] = tuple(handlers.values())
+        else:
+            self._snapshots.pop(event, None)
+
+    def _add_event_handler(self, event: str, k: Callable, v: Callable):
+        super()._add_event_handler(event, k, v)
+
+        with self._lock:
+            self._update_snapshot(event)
+
+    def _remove_listener(self, event: str, f: Callable) -> None:
+        super()._remove_listener(event, f)
+        self._update_snapshot(event)
+
+    def remove_all_listeners(self, event: Optional[str] = None) -> None:
+        super().remove_all_listeners(event)
+
+        with self._lock:
+            if event is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(event, None)
+
+    def _call_handlers(
+        self,
+        event: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> bool:
+        handlers = self._snapshots.get(event, ())
+
+        for f in handlers:
+            f(*args, **kwargs)
+
+        return bool(handlers)
+
+    def snapshot(self, event: str) -> Tuple[Callable[..., Any], ...]:
+        """
+        Return the handlers currently registered for ``event``.
+
+        :param event: Event name, for example ``"candle.close"``
+        :type event: :class:`str`
+        :return: Registered handlers in order of registration
+        :rtype: :class:`tuple` of callables
+        """
+        return self._snapshots.get(event, ())
+
+    def bind_emitter(self, event: str) -> Callable[..., None]:
+        """
+        Return a function that emits ``event`` when called.
+
+        Unlike :func:`bind`, the returned function looks up the current
+        handlers on each call, so listeners added or removed later are
+        respected. It skips the argument handling and ``error`` event checks
+        of :meth:`emit`.
+
+        :param event: Event name, for example ``"pivot.confirm"``
+        :type event: :class:`str`
+        :return: A function accepting the event arguments
+        :rtype: :class:`~typing.Callable`
+
+        .. code-block:: python
+
+            emit_pivot = event_bus.bind_emitter("pivot.confirm")
+            emit_pivot(pivot, candle)
+        """
+        snapshots = self._snapshots
+
+        def emit(*args: Any, **kwargs: Any) -> None:
+            for f in snapshots.get(event, ()):
+                f(*args, **kwargs)
+
+        return emit
+
+
+event_bus = EventBus()
+
+
+def bind(event: str) -> Tuple[Callable[..., Any], ...]:
+    """
+    Return a snapshot of the listeners currently registered for ``event``.
+
+    Calling the listeners directly skips the event lookup performed by
+    :meth:`EventBus.emit` on every event.
+
+    :param event: Event name, for example ``"candle.close"``
+    :type event: :class:`str`
+    :return: Registered listeners in order of registration
+    :rtype: :class:`tuple` of callables
+
+    .. warning::
+       Listeners added or removed after this call are not reflected in the
+       returned tuple.
+    """
+    return event_bus.snapshot(event)
@@ -1,17 +1,43 @@
+from collections import deque
 from .base.pattern import BasePattern, Registry
 from .dtypes import Candle, Pivot, EODTimeframes
-from .doubly_linked_list import DoublyLinkedList
-from typing import Dict
+from .ring_buffer import PivotRecord, RingBuffer, to_record
+from typing import Any, Callable, Deque, Dict, Optional
+
+USE_RING_BUFFER = True
+"""Store pattern pivots in a :class:`~.RingBuffer`. If ``False``, fallback to
+a bounded :class:`collections.deque`. Both store pivots as
+:data:`~.PivotRecord` tuples."""
+
+PIVOT_BUFFER_SIZE = 2048
+"""Default number of pivots retained by a pattern."""
 
 
 class PatternManager:
-    def __init__(self, *args, **kwargs) -> None:
+    """
+    Create pattern instances per symbol and timeframe, and forward pivots
+    to them.
+
+    ``args`` and ``kwargs`` are passed to every registered pattern. Options
+    accepted by only some patterns must be passed via ``options``. If a key is
+    in both ``kwargs`` and ``options``, the value in ``options`` is used.
+
+    :param options: Mapping of pattern name to keyword arguments for that
+                    pattern only. For example,
+                    ``PatternManager(options={"VCP": {"lookback": 512}})``
+    :type options: :class:`dict` [:class:`str`, :class:`dict`] or ``None``
+    """
+
+    def __init__(
+        self, *args, options: Optional[Dict[str, Dict[str, Any]]] = None, **kwargs
+    ) -> None:
         super().__init__()
 
         self.buffer: Dict[str, Dict[EODTimeframes | int, Dict[str, BasePattern]]] = {}
         self.ptn_dct = Registry.all()
         self.args = args
         self.kwargs = kwargs
+        self.options = options or {}
 
     def on_pivot(self, pivot: Pivot, candle: Candle):
         symbol = pivot["symbol"]
@@ -26,18 +52,42 @@ class PatternManager:
         for name in self.ptn_dct:
             if name not in self.buffer[symbol][tf]:
                 self.buffer[symbol][tf][name] = self.ptn_dct[name](
-                    *self.args, **self.kwargs
+                    *self.args, **{**self.kwargs, **self.options.get(name, {})}
                 )
 
             self.buffer[symbol][tf][name].on_pivot(pivot, candle)
 
 
 class VCP(BasePattern):
+    """
+    Volatility Contraction Pattern (VCP)
+
+    :param lookback: Maximum number of recent pivots retained. Once full, the
+                     oldest pivot is discarded on every new pivot.
+    :type lookback: :class:`int`
+
+    .. note::
+       ``lookback`` is specific to VCP. When using :class:`PatternManager`,
+       pass it as ``options={"VCP": {"lookback": 512}}``.
+
+    .. attribute:: pivots
+
+       Recent pivots as :data:`~.PivotRecord` tuples, oldest first.
+    """
+
     name = "VCP"
 
-    def __init__(self) -> None:
+    def __init__(self, lookback: int = PIVOT_BUFFER_SIZE) -> None:
         super().__init__()
-        self.dll = DoublyLinkedList()
+        self.pivots: RingBuffer | Deque[PivotRecord]
+
+        if USE_RING_BUFFER:
+            self.pivots = RingBuffer(lookback)
+            self._append: Callable[[Pivot], Any] = self.pivots.append
+        else:
+            pivots: Deque[PivotRecord] = deque(maxlen=lookback)
+            self.pivots = pivots
+            self._append = lambda pivot: pivots.append(to_record(pivot))
 
     def on_pivot(self, pivot: Pivot, candle: Candle):
-        pass
+        self._append(pivot)
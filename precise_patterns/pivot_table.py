@@ -0,0 +1,110 @@
+from __future__ import annotations
+from array import array
+from .dtypes import EODTimeframes, Pivot
+from .encoding import (
+    EPOCH,
+    PIVOT_KIND,
+    PIVOT_TYPE,
+    decode_timestamp,
+    encode_timestamp,
+    epoch_for,
+)
+
+
+class PivotTable:
+    """
+    An append-only, column-oriented store of pivots for a single symbol
+    and timeframe.
+
+    Pivot fields are stored in :class:`array.array` columns. Appending a
+    pivot appends one value to each column instead of retaining a
+    :class:`~precise_patterns.dtypes.Pivot` dict.
+
+    :param symbol: Trading symbol of the stored pivots.
+    :type symbol: :class:`str`
+    :param timeframe: Timeframe of the stored pivots.
+    :type timeframe: :class:`~precise_patterns.dtypes.EODTimeframes` or :class:`int`
+
+    .. note::
+       Timestamps are stored as microseconds since the Unix epoch. If the
+       first pivot has a timezone-aware timestamp, its ``tzinfo`` is used to
+       encode and decode all timestamps in the table.
+
+    .. seealso:: :class:`~precise_patterns.ring_buffer.RingBuffer`
+    """
+
+    __slots__ = (
+        "symbol",
+        "timeframe",
+        "_timestamp",
+        "_price",
+        "_type",
+        "_volume",
+        "_epoch",
+    )
+
+    def __init__(self, symbol: str, timeframe: EODTimeframes | int) -> None:
+        self.symbol = symbol
+        self.timeframe = timeframe
+
+        self._timestamp = array("q")
+        self._price = array("d")
+        self._type = array("b")
+        self._volume = array("d")
+        self._epoch = EPOCH
+
+    def __len__(self) -> int:
+        """
+        Return the number of pivots in the table.
+
+        :returns: The table size.
+        :rtype: int
+        """
+        return len(self._price)
+
+    def append(self, pivot: Pivot) -> int:
+        """
+        Append a pivot to the table.
+
+        :param pivot: Pivot to append.
+        :type pivot: :class:`~precise_patterns.dtypes.Pivot`
+        :returns: Row index of the appended pivot.
+        :rtype: int
+        """
+        i = len(self._price)
+
+        if not i:
+            self._epoch = epoch_for(pivot["timestamp"])
+
+        self._timestamp.append(encode_timestamp(pivot["timestamp"], self._epoch))
+        self._price.append(pivot["price"])
+        self._type.append(PIVOT_KIND[pivot["type"]])
+        self._volume.append(pivot["volume"])
+        return i
+
+    def view(self, i: int) -> Pivot:
+        """
+        Return the pivot at row ``i``.
+
+        :param i: Row index. Negative values index from the end.
+        :type i: int
+        :returns: A new :class:`~precise_patterns.dtypes.Pivot` dict.
+        :rtype: :class:`~precise_patterns.dtypes.Pivot`
+        :raises IndexError: If ``i`` is out of range.
+        """
+        size = len(self._price)
+
+        if i < 0:
+            i += size
+
+        if not 0 <= i < size:
+            raise IndexError("PivotTable index out of range")
+
+        return Pivot(
+            symbol=self.symbol,
+            type=PIVOT_TYPE[self._type[i]],
+            timeframe=self.timeframe,
+            timestamp=decode_timestamp(self._timestamp[i], self._epoch),
+            price=self._price[i],
+            volume=self._volume[i],
+        )
@@ -1,8 +1,9 @@
 from collections import deque
-from typing import Deque, Dict
+from typing import Any, Callable, Deque, Dict
 from .dtypes import Candle, Pivot, EODTimeframes
 from .events import event_bus
 from .base.pivot import BasePivotDetector
+from .pivot_table import PivotTable
 
 
 class MinMax:
@@ -27,6 +28,14 @@ class MinMax:
         Total number of candles to maintain in the rolling window.
     :param int pivot_pos:
         Index of the pivot candle within the buffer.
+    :param table:
+        If provided, confirmed pivots are also appended to this table.
+    :type table: :class:`~precise_patterns.pivot_table.PivotTable` or ``None``
+    :param emit:
+        Function called with ``(pivot, candle)`` when a pivot is confirmed.
+        Defaults to an emitter for ``pivot.confirm`` from
+        :meth:`~precise_patterns.events.EventBus.bind_emitter`.
+    :type emit: :class:`~typing.Callable` or ``None``
 
     **Attributes**
         .. attribute:: buffer_length
@@ -50,9 +59,17 @@ class MinMax:
            A monotonic deque maintaining rolling maximum candle highs.
     """
 
-    def __init__(self, length: int, pivot_pos: int) -> None:
+    def __init__(
+        self,
+        length: int,
+        pivot_pos: int,
+        table: PivotTable | None = None,
+        emit: Callable[..., Any] | None = None,
+    ) -> None:
         self.buffer_length = length
         self.pivot_pos = pivot_pos
+        self.table = table
+        self.emit = emit or event_bus.bind_emitter("pivot.confirm")
         self.buffer: Deque[Candle] = deque(maxlen=self.buffer_length)
         self.min: Deque[Candle] = deque()
         self.max: Deque[Candle] = deque()
@@ -94,33 +111,35 @@ class MinMax:
         pivot_candle = self.buffer[self.pivot_pos]
 
         if self.max and self.max[0] is pivot_candle:
-            event_bus.emit(
-                "pivot.confirm",
-                Pivot(
-                    symbol=pivot_candle["symbol"],
-                    type="high",
-                    timeframe=pivot_candle["timeframe"],
-                    timestamp=pivot_candle["timestamp"],
-                    price=pivot_candle["high"],
-                    volume=pivot_candle["volume"],
-                ),
-                candle,
+            pivot = Pivot(
+                symbol=pivot_candle["symbol"],
+                type="high",
+                timeframe=pivot_candle["timeframe"],
+                timestamp=pivot_candle["timestamp"],
+                price=pivot_candle["high"],
+                volume=pivot_candle["volume"],
             )
 
+            if self.table is not None:
+                self.table.append(pivot)
+
+            self.emit(pivot, candle)
+
         if self.min and self.min[0] is pivot_candle:
-            event_bus.emit(
-                "pivot.confirm",
-                Pivot(
-                    symbol=pivot_candle["symbol"],
-                    type="low",
-                    timeframe=pivot_candle["timeframe"],
-                    timestamp=pivot_candle["timestamp"],
-                    price=pivot_candle["low"],
-                    volume=pivot_candle["volume"],
-                ),
-                candle,
+            pivot = Pivot(
+                symbol=pivot_candle["symbol"],
+                type="low",
+                timeframe=pivot_candle["timeframe"],
+                timestamp=pivot_candle["timestamp"],
+                price=pivot_candle["low"],
+                volume=pivot_candle["volume"],
             )
 
+            if self.table is not None:
+                self.table.append(pivot)
+
+            self.emit(pivot, candle)
+
 
 class PivotDetector(BasePivotDetector):
     """
@@ -136,6 +155,10 @@ class PivotDetector(BasePivotDetector):
         than 0
     :param int right_bars:
         Number of candles to the *right* of the pivot candle. Must be greater than 0
+    :param bool keep_history:
+        If ``True``, confirmed pivots are also stored in a
+        :class:`~precise_patterns.pivot_table.PivotTable` per symbol and timeframe.
+        Defaults to ``False``
 
     :raises ValueError:
         If ``left_bars`` or ``right_bars`` is 0
@@ -155,15 +178,25 @@ class PivotDetector(BasePivotDetector):
 
            Position of the pivot candle within each rolling window,
            equal to ``left_bars``.
+
+        .. attribute:: history
+
+           Nested mapping of ``symbol -> timeframe -> PivotTable``, populated
+           only if ``keep_history`` is ``True``.
     """
 
-    def __init__(self, left_bars=6, right_bars=6) -> None:
+    def __init__(self, left_bars=6, right_bars=6, keep_history=False) -> None:
         super().__init__()
 
         self.buffer_length = left_bars + 1 + right_bars
         self.pivot_pos = left_bars
+        self.keep_history = keep_history
 
         self.buffer: Dict[str, Dict[EODTimeframes | int, MinMax]] = {}
+        self.history: Dict[str, Dict[EODTimeframes | int, PivotTable]] = {}
+
+        # Shared by all MinMax instances
+        self._emit_pivot = event_bus.bind_emitter("pivot.confirm")
 
     def on_candle_close(self, candle: Candle) -> None:
         """
@@ -188,9 +221,16 @@ class PivotDetector(BasePivotDetector):
             self.buffer[sym] = {}
 
         if tf not in self.buffer[sym]:
+            table = None
+
+            if self.keep_history:
+                table = self.history.setdefault(sym, {})[tf] = PivotTable(sym, tf)
+
             self.buffer[sym][tf] = MinMax(
                 length=self.buffer_length,
                 pivot_pos=self.pivot_pos,
+                table=table,
+                emit=self._emit_pivot,
             )
 
         self.buffer[sym][tf].update(candle)
@@ -0,0 +1,319 @@
+from __future__ import annotations
+from array import array
+from datetime import datetime
+from typing import Iterator, Literal, Tuple
+from .dtypes import Pivot
+from .encoding import (
+    EPOCH,
+    PIVOT_KIND,
+    PIVOT_TYPE,
+    decode_timestamp,
+    encode_timestamp,
+    epoch_for,
+)
+
+Handle = Tuple[int, int]
+"""A ``(slot index, generation)`` pair referencing an entry in a :class:`RingBuffer`."""
+
+PivotRecord = Tuple[datetime, float, Literal["high", "low"], float]
+"""A ``(timestamp, price, type, volume)`` tuple as returned by :class:`RingBuffer`."""
+
+
+def to_record(pivot: Pivot) -> PivotRecord:
+    """
+    Convert a pivot into the record returned by :class:`RingBuffer`.
+
+    :param pivot: Pivot to convert.
+    :type pivot: :class:`~precise_patterns.dtypes.Pivot`
+    :returns: The ``(timestamp, price, type, volume)`` tuple.
+    :rtype: :data:`PivotRecord`
+    """
+    return pivot["timestamp"], pivot["price"], pivot["type"], pivot["volume"]
+
+
+class RingBuffer:
+    """
+    A fixed-capacity ring buffer of pivots.
+
+    Pivot fields are stored column-wise in preallocated :class:`array.array`
+    buffers (timestamp, price, type and volume), so appending a pivot writes
+    four slots instead of allocating a node object. Once full, appending a pivot
+    overwrites the oldest entry, similar to a :class:`collections.deque`
+    created with ``maxlen``.
+
+    :param capacity: Maximum number of pivots held in the buffer.
+    :type capacity: :class:`int`
+    :raises ValueError: If ``capacity`` is less than 1.
+
+    .. note::
+       Timestamps are stored as microseconds since the Unix epoch. If the
+       first pivot appended to an empty buffer has a timezone-aware
+       timestamp, its ``tzinfo`` is used to encode and decode timestamps,
+       until the buffer is empty again.
+
+    .. note::
+       :meth:`append` returns a :data:`Handle` instead of a node reference.
+       A handle becomes stale once its slot is removed or overwritten.
+       :meth:`remove_node` marks the slot as removed. Removed slots are skipped
+       during iteration and reclaimed when they reach either end of the buffer.
+       Appending to a full buffer with removed slots first compacts the
+       remaining pivots, so no pivot is overwritten while space is free.
+       Handles to pivots moved by compaction become stale.
+
+    .. seealso:: :class:`~precise_patterns.doubly_linked_list.DoublyLinkedList`
+    """
+
+    __slots__ = (
+        "_cap",
+        "_buf_time",
+        "_buf_price",
+        "_buf_kind",
+        "_buf_volume",
+        "_gen",
+        "_head",
+        "_size",
+        "_dead",
+        "_epoch",
+    )
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be greater than 0")
+
+        self._cap = capacity
+        self._buf_time = array("q", [0]) * capacity
+        self._buf_price = array("d", [0.0]) * capacity
+        self._buf_kind = array("b", [0]) * capacity
+        self._buf_volume = array("d", [0.0]) * capacity
+        self._gen = array("Q", [0]) * capacity
+        self._head = 0
+        self._size = 0
+        self._dead = 0
+        self._epoch = EPOCH
+
+    def __len__(self) -> int:
+        """
+        Return the number of pivots in the buffer.
+
+        :returns: The buffer size, excluding removed slots.
+        :rtype: int
+        """
+        return self._size - self._dead
+
+    def _record(self, idx: int) -> PivotRecord:
+        return (
+            decode_timestamp(self._buf_time[idx], self._epoch),
+            self._buf_price[idx],
+            PIVOT_TYPE[self._buf_kind[idx]],
+            self._buf_volume[idx],
+        )
+
+    def __iter__(self) -> Iterator[PivotRecord]:
+        """
+        Iterate over the buffer from oldest to newest pivot.
+
+        :returns: An iterator over ``(timestamp, price, type, volume)`` tuples.
+        :rtype: Iterator[:data:`PivotRecord`]
+        """
+        kind = self._buf_kind
+        cap = self._cap
+        head = self._head
+
+        for i in range(self._size):
+            idx = (head + i) % cap
+            if kind[idx]:
+                yield self._record(idx)
+
+    def __reversed__(self) -> Iterator[PivotRecord]:
+        """
+        Iterate over the buffer from newest to oldest pivot.
+
+        :returns: A reverse iterator over ``(timestamp, price, type, volume)`` tuples.
+        :rtype: Iterator[:data:`PivotRecord`]
+        """
+        kind = self._buf_kind
+        cap = self._cap
+        head = self._head
+
+        for i in range(self._size - 1, -1, -1):
+            idx = (head + i) % cap
+            if kind[idx]:
+                yield self._record(idx)
+
+    def append(self, pivot: Pivot) -> Handle:
+        """
+        Append a pivot to the end of the buffer.
+
+        If the buffer is full, removed slots are reclaimed first. If none are
+        removed, the oldest pivot is overwritten.
+
+        :param pivot: Pivot to append.
+        :type pivot: :class:`~precise_patterns.dtypes.Pivot`
+        :returns: A handle to the newly written slot.
+        :rtype: :data:`Handle`
+        """
+        if not self._size:
+            self._epoch = epoch_for(pivot["timestamp"])
+
+        if self._size == self._cap and self._dead:
+            self._compact()
+
+        if self._size == self._cap:
+            idx = self._head
+            self._head = (idx + 1) % self._cap
+        else:
+            idx = (self._head + self._size) % self._cap
+            self._size += 1
+
+        self._buf_time[idx] = encode_timestamp(pivot["timestamp"], self._epoch)
+        self._buf_price[idx] = pivot["price"]
+        # 0 in the kind column marks a removed slot
+        self._buf_kind[idx] = PIVOT_KIND[pivot["type"]]
+        self._buf_volume[idx] = pivot["volume"]
+        self._gen[idx] += 1
+
+        return idx, self._gen[idx]
+
+    def get(self, handle: Handle) -> PivotRecord:
+        """
+        Return the pivot referenced by ``handle``.
+
+        :param handle: Handle returned by :meth:`append`.
+        :type handle: :data:`Handle`
+        :returns: The ``(timestamp, price, type, volume)`` tuple.
+        :rtype: :data:`PivotRecord`
+        :raises KeyError: If the handle is stale.
+        """
+        idx = self._validate(handle)
+        return self._record(idx)
+
+    def pop(self) -> PivotRecord:
+        """
+        Remove and return the newest pivot.
+
+        :returns: The removed ``(timestamp, price, type, volume)`` tuple.
+        :rtype: :data:`PivotRecord`
+        :raises IndexError: If the buffer is empty.
+        """
+        self._trim()
+
+        if not self._size:
+            raise IndexError("pop from empty buffer")
+
+        idx = (self._head + self._size - 1) % self._cap
+        record = self._record(idx)
+        self._release(idx)
+        self._size -= 1
+        return record
+
+    def popleft(self) -> PivotRecord:
+        """
+        Remove and return the oldest pivot.
+
+        :returns: The removed ``(timestamp, price, type, volume)`` tuple.
+        :rtype: :data:`PivotRecord`
+        :raises IndexError: If the buffer is empty.
+        """
+        self._trim()
+
+        if not self._size:
+            raise IndexError("popleft from empty buffer")
+
+        idx = self._head
+        record = self._record(idx)
+        self._release(idx)
+        self._head = (idx + 1) % self._cap
+        self._size -= 1
+        return record
+
+    def remove_node(self, handle: Handle) -> None:
+        """
+        Remove the pivot referenced by ``handle``.
+
+        The slot is only marked as removed. It is reclaimed once it reaches
+        either end of the buffer, or when a full buffer is compacted.
+
+        :param handle: Handle returned by :meth:`append`.
+        :type handle: :data:`Handle`
+        :returns: ``None``
+        :rtype: None
+        :raises KeyError: If the handle is stale.
+        """
+        idx = self._validate(handle)
+        self._release(idx)
+        self._dead += 1
+        self._trim()
+
+    def clear(self) -> None:
+        """
+        Remove all pivots from the buffer.
+
+        All outstanding handles become stale.
+
+        :returns: ``None``
+        :rtype: None
+        """
+        for i in range(self._size):
+            self._release((self._head + i) % self._cap)
+
+        self._head = 0
+        self._size = 0
+        self._dead = 0
+
+    def _validate(self, handle: Handle) -> int:
+        idx, gen = handle
+
+        if (
+            not (0 <= idx < self._cap)
+            or self._gen[idx] != gen
+            or not self._buf_kind[idx]
+        ):
+            raise KeyError(f"stale handle {handle!r}")
+
+        return idx
+
+    def _release(self, idx: int) -> None:
+        # Bump the generation, so existing handles to this slot become stale
+        self._buf_kind[idx] = 0
+        self._gen[idx] += 1
+
+    def _trim(self) -> None:
+        # Reclaim removed slots at either end of the buffer
+        kind = self._buf_kind
+
+        while self._size and not kind[self._head]:
+            self._head = (self._head + 1) % self._cap
+            self._size -= 1
+            self._dead -= 1
+
+        while self._size and not kind[(self._head + self._size - 1) % self._cap]:
+            self._size -= 1
+            self._dead -= 1
+
+    def _compact(self) -> None:
+        # Move live slots towards the head, reclaiming all removed slots.
+        # Moved slots get a new generation, so their old handles become stale.
+        kind = self._buf_kind
+        cap = self._cap
+        head = self._head
+        j = 0
+
+        for i in range(self._size):
+            src = (head + i) % cap
+
+            if not kind[src]:
+                continue
+
+            if i != j:
+                dst = (head + j) % cap
+                self._buf_time[dst] = self._buf_time[src]
+                self._buf_price[dst] = self._buf_price[src]
+                self._buf_volume[dst] = self._buf_volume[src]
+                kind[dst] = kind[src]
+                self._gen[dst] += 1
+                self._release(src)
+
+            j += 1
+
+        self._size = j
+        self._dead = 0
@@ -1,9 +1,44 @@
 from pathlib import Path
-from ..dtypes import Candle
+from queue import Queue
+from threading import Thread
+from typing import Dict, List, Optional, Set, Tuple
+from ..dtypes import Candle, EODTimeframes, OHLCRow
+
+Chunk = Tuple[EODTimeframes | int, str, List[OHLCRow]]
 
 
 class CSVStorage:
-    def __init__(self, folder: Path | str) -> None:
+    """
+    Store closed candles as CSV files, one file per timeframe and symbol.
+
+    Candles are buffered as tuples. Once ``chunk_size`` rows are buffered for
+    a file, the buffer is handed over to a background writer thread and a new
+    buffer is started. The writer formats and appends the rows to
+    ``<folder>/<timeframe>/<symbol>.csv``, so disk writes do not block
+    candle processing.
+
+    :param folder: Folder path to store CSV files.
+    :type folder: :class:`pathlib.Path` | :class:`str`
+    :param chunk_size: Number of rows buffered per file before writing to disk.
+    :type chunk_size: :class:`int`
+    :param max_pending: Maximum number of full buffers waiting to be written.
+                        When reached, :meth:`on_candle` blocks until the writer
+                        catches up.
+    :type max_pending: :class:`int`
+
+    .. warning::
+       :meth:`save` must be called to write the remaining rows and stop the
+       writer thread.
+
+    .. note::
+       If writing a file fails, later rows for that file are dropped and the
+       error is raised by the next :meth:`flush` or :meth:`save`. Other files
+       are still written.
+    """
+
+    def __init__(
+        self, folder: Path | str, chunk_size: int = 65536, max_pending: int = 4
+    ) -> None:
         if isinstance(folder, str):
             folder = Path(folder)
 
@@ -12,7 +47,18 @@ class CSVStorage:
         if not self.folder.exists():
             self.folder.mkdir(parents=True)
 
-        self.data = {}
+        self.chunk_size = chunk_size
+        self.data: Dict[EODTimeframes | int, Dict[str, List[OHLCRow]]] = {}
+
+        self._queue: Queue[Optional[Chunk]] = Queue(maxsize=max_pending)
+        self._writer: Optional[Thread] = None
+        self._error: Optional[BaseException] = None
+
+        # Files written to in this session. Later chunks are appended.
+        self._started: Set[Path] = set()
+
+        # Files that failed to write. Later chunks are dropped.
+        self._failed: Set[Path] = set()
 
     def on_candle(self, c: Candle):
         tf = c["timeframe"]
@@ -22,25 +68,101 @@ class CSVStorage:
             self.data[tf] = {}
 
         if sym not in self.data[tf]:
-            self.data[tf][sym] = ["Date,Open,High,Low,Close,Volume"]
+            self.data[tf][sym] = []
 
-        ts = c["timestamp"].strftime("%Y-%m-%d") if tf == "D" else c["timestamp"]
+        rows = self.data[tf][sym]
 
-        self.data[tf][sym].append(
-            f"{ts},{c['open']},{c['high']},{c['low']},{c['close']},{c['volume']}"
+        rows.append(
+            (c["timestamp"], c["open"], c["high"], c["low"], c["close"], c["volume"])
         )
 
+        if len(rows) >= self.chunk_size:
+            self.flush(tf, sym)
+
+    def flush(self, tf: EODTimeframes | int, sym: str):
+        """
+        Hand over buffered rows for ``tf`` and ``sym`` to the writer thread.
+
+        :param tf: Timeframe of the buffered candles
+        :type tf: :class:`~precise_patterns.dtypes.EODTimeframes` or :class:`int`
+        :param sym: Symbol of the buffered candles
+        :type sym: :class:`str`
+        :raises Exception: Any error raised previously by the writer thread.
+        """
+        if self._error:
+            raise self._error
+
+        self._put(tf, sym)
+
     def save(self):
-        if not self.data:
+        """
+        Write all buffered rows to disk and wait for the writer thread to finish.
+
+        If the writer thread failed, rows for the other files are still
+        written before the error is raised.
+
+        :raises Exception: Any error raised by the writer thread.
+        """
+        try:
+            for tf in self.data:
+                for sym in self.data[tf]:
+                    self._put(tf, sym)
+        finally:
+            if self._writer is not None:
+                self._queue.put(None)
+                self._writer.join()
+                self._writer = None
+
+        if self._error:
+            raise self._error
+
+    def _put(self, tf: EODTimeframes | int, sym: str):
+        rows = self.data[tf][sym]
+
+        if not rows:
+            return
+
+        if self._writer is None:
+            self._writer = Thread(target=self._write_loop, daemon=True)
+            self._writer.start()
+
+        self.data[tf][sym] = []
+        self._queue.put((tf, sym, rows))
+
+    def _write_loop(self):
+        while (chunk := self._queue.get()) is not None:
+            # Keep consuming after an error, so producers never block on a
+            # full queue. The first error is raised on the next flush or save.
+            try:
+                self._write(*chunk)
+            except BaseException as e:
+                if self._error is None:
+                    self._error = e
+
+    def _write(self, tf: EODTimeframes | int, sym: str, rows: List[OHLCRow]):
+        tf_folder = self.folder / str(tf)
+        file = tf_folder / f"{sym}.csv"
+
+        if file in self._failed:
             return
 
-        for tf in self.data:
-            tf_folder = self.folder / str(tf)
+        if tf == "D":
+            text = "".join(
+                f"\n{ts:%Y-%m-%d},{o},{h},{l},{c},{v}" for ts, o, h, l, c, v in rows
+            )
+        else:
+            text = "".join(f"\n{ts},{o},{h},{l},{c},{v}" for ts, o, h, l, c, v in rows)
 
+        try:
             if not tf_folder.exists():
                 tf_folder.mkdir(parents=True)
 
-            for sym in self.data[tf]:
-                file = tf_folder / f"{sym}.csv"
-
-                file.write_text("\n".join(self.data[tf][sym]))
+            if file in self._started:
+                with file.open("a") as f:
+                    f.write(text)
+            else:
+                file.write_text("Date,Open,High,Low,Close,Volume" + text)
+                self._started.add(file)
+        except BaseException:
+            self._failed.add(file)
+            raise
@@ -1,7 +1,7 @@
 import context
-from typing import List, Deque
+from typing import List, Deque, Literal
 from precise_patterns.dtypes import Pivot, Candle
-from datetime import datetime
+from datetime import datetime, timedelta
 
 
 class FakeBus:
@@ -17,6 +17,9 @@ class FakeBus:
     def emit(self, event: str, *args):
         self.calls.append(args)
 
+    def bind_emitter(self, event: str):
+        return lambda *args: self.emit(event, *args)
+
 
 def candle(high: float, low: float, ts: datetime) -> Candle:
     """Helper function to generate Candle Dicts"""
@@ -32,6 +35,34 @@ def candle(high: float, low: float, ts: datetime) -> Candle:
     )
 
 
+def minute_candle(i: int, tf: int | str = 5, symbol="A") -> Candle:
+    """Helper function to generate the i-th Candle Dict in 5 minute steps"""
+    return Candle(
+        symbol=symbol,
+        timeframe=tf,
+        timestamp=datetime(2025, 1, 1, 9, 15) + timedelta(minutes=5 * i),
+        open=100 + i,
+        high=101.5 + i,
+        low=99 + i,
+        close=100.25 + i,
+        volume=10 * i,
+    )
+
+
+def pivot(
+    price: float, ts: datetime, type: Literal["high", "low"] = "high", volume=1000
+) -> Pivot:
+    """Helper function to generate Pivot Dicts"""
+    return Pivot(
+        symbol="FOO",
+        type=type,
+        timeframe="D",
+        timestamp=ts,
+        price=price,
+        volume=volume,
+    )
+
+
 def is_monotonic_decreasing(lst: Deque[Candle]) -> bool:
     """Test if candle highs are in descending order"""
     return all([lst[i]["high"] >= lst[i + 1]["high"] for i in range(len(lst) - 1)])
@@ -0,0 +1,99 @@
+import context
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from precise_patterns.readers.csv import CSVReader
+
+
+class TestCSVReader(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp.name)
+        self.start = datetime(2025, 1, 1)
+
+        # Daily rows with a gap every 7th day, like weekends
+        self.dates = [
+            self.start + timedelta(i) for i in range(60) if i % 7 not in (5, 6)
+        ]
+
+        lines = ["Date,Open,High,Low,Close,Volume"]
+
+        for i, dt in enumerate(self.dates):
+            lines.append(f"{dt:%Y-%m-%d},{100 + i},{101 + i},{99 + i},{100.5 + i},{i}")
+
+        (self.folder / "FOO.csv").write_text("\n".join(lines) + "\n")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def read(self, from_date=None, chunk_size=65536):
+        reader = CSVReader(self.folder, date_format="%Y-%m-%d", from_date=from_date)
+        batches = list(reader.stream_batches("FOO", chunk_size=chunk_size))
+        rows = list(reader.stream("FOO"))
+
+        self.assertEqual([c for batch in batches for c in batch], rows)
+        return batches, rows
+
+    def test_stream_without_from_date(self):
+        batches, rows = self.read()
+
+        self.assertEqual(len(batches), 1)
+        self.assertEqual([c["timestamp"] for c in rows], self.dates)
+        self.assertEqual(rows[1]["open"], 101)
+        self.assertEqual(rows[1]["close"], 101.5)
+        self.assertEqual(rows[1]["volume"], 1)
+
+    def test_from_date_inside_file(self):
+        for from_date in (
+            self.start - timedelta(10),
+            self.start,
+            self.start + timedelta(3),
+            self.start + timedelta(5),  # no row on this date
+            self.dates[-1],
+        ):
+            with self.subTest(from_date=from_date):
+                _, rows = self.read(from_date)
+
+                self.assertEqual(
+                    [c["timestamp"] for c in rows],
+                    [dt for dt in self.dates if dt >= from_date],
+                )
+
+    def test_from_date_without_trailing_newline(self):
+        file = self.folder / "FOO.csv"
+        file.write_text(file.read_text().rstrip("\n"))
+
+        for from_date in (self.start + timedelta(3), self.dates[-1]):
+            with self.subTest(from_date=from_date):
+                _, rows = self.read(from_date)
+
+                self.assertEqual(
+                    [c["timestamp"] for c in rows],
+                    [dt for dt in self.dates if dt >= from_date],
+                )
+
+    def test_from_date_past_end(self):
+        batches, rows = self.read(self.dates[-1] + timedelta(1))
+
+        self.assertEqual(rows, [])
+        self.assertEqual([c for batch in batches for c in batch], [])
+
+    def test_chunk_size_smaller_than_line(self):
+        """Every batch holds at least one row"""
+        batches, rows = self.read(chunk_size=1)
+
+        self.assertEqual(len(batches), len(self.dates))
+        self.assertEqual([c["timestamp"] for c in rows], self.dates)
+
+        batches, rows = self.read(self.start + timedelta(10), chunk_size=1)
+
+        self.assertTrue(all(batches))
+        self.assertEqual(
+            [c["timestamp"] for c in rows],
+            [dt for dt in self.dates if dt >= self.start + timedelta(10)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import context
+import helpers
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from precise_patterns.storage.csv import CSVStorage
+
+
+class TestCSVStorage(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp.name)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def write(self, folder: Path, candles, **kwargs) -> CSVStorage:
+        storage = CSVStorage(folder, **kwargs)
+
+        for c in candles:
+            storage.on_candle(c)
+
+        storage.save()
+        return storage
+
+    def test_output_same_across_chunk_sizes(self):
+        candles = [helpers.minute_candle(i) for i in range(10)]
+        candles += [helpers.minute_candle(i, tf="D", symbol="B") for i in range(5)]
+
+        self.write(self.folder / "one", candles)
+        self.write(self.folder / "many", candles, chunk_size=3, max_pending=1)
+
+        for file in ("5/A.csv", "D/B.csv"):
+            with self.subTest(file=file):
+                self.assertEqual(
+                    (self.folder / "many" / file).read_bytes(),
+                    (self.folder / "one" / file).read_bytes(),
+                )
+
+        lines = (self.folder / "many/5/A.csv").read_text().split("\n")
+
+        self.assertEqual(len(lines), 11)
+        self.assertEqual(lines[0], "Date,Open,High,Low,Close,Volume")
+        self.assertEqual(lines[1], "2025-01-01 09:15:00,100,101.5,99,100.25,0")
+        self.assertEqual(
+            (self.folder / "many/D/B.csv").read_text().split("\n")[1],
+            "2025-01-01,100,101.5,99,100.25,0",
+        )
+
+    def test_append_across_saves(self):
+        storage = CSVStorage(self.folder, chunk_size=2)
+
+        for i in range(3):
+            storage.on_candle(helpers.minute_candle(i))
+
+        storage.save()
+
+        for i in range(3, 6):
+            storage.on_candle(helpers.minute_candle(i))
+
+        storage.save()
+
+        self.write(self.folder / "once", [helpers.minute_candle(i) for i in range(6)])
+
+        self.assertEqual(
+            (self.folder / "5/A.csv").read_bytes(),
+            (self.folder / "once/5/A.csv").read_bytes(),
+        )
+
+    def test_max_pending_blocks_producer(self):
+        storage = CSVStorage(self.folder, chunk_size=1, max_pending=1)
+        started = threading.Event()
+        release = threading.Event()
+        self.addCleanup(release.set)
+        write = storage._write
+
+        def slow_write(*args):
+            started.set()
+            release.wait()
+            write(*args)
+
+        storage._write = slow_write
+
+        producer = threading.Thread(
+            target=lambda: [
+                storage.on_candle(helpers.minute_candle(i)) for i in range(5)
+            ]
+        )
+        producer.start()
+
+        # Wait until the writer holds one chunk and another fills the queue
+        deadline = time.monotonic() + 5
+
+        while not (started.is_set() and storage._queue.full()):
+            if time.monotonic() > deadline:
+                self.fail("writer queue did not fill up")
+
+            time.sleep(0.01)
+
+        # Remaining chunks cannot be queued, so the producer is blocked
+        producer.join(0.05)
+        self.assertTrue(producer.is_alive())
+
+        release.set()
+        producer.join()
+        storage.save()
+
+        self.assertEqual(len((self.folder / "5/A.csv").read_text().split("\n")), 6)
+
+    def test_error_raised_and_writer_stopped(self):
+        # A file in place of the timeframe folder makes writes fail
+        (self.folder / "5").write_text("")
+
+        storage = CSVStorage(self.folder, chunk_size=2)
+
+        for i in range(5):
+            storage.on_candle(helpers.minute_candle(i, tf=5))
+            storage.on_candle(helpers.minute_candle(i, tf=15))
+
+        writer = storage._writer
+
+        with self.assertRaises(OSError):
+            storage.save()
+
+        self.assertFalse(writer.is_alive())
+        self.assertIsNone(storage._writer)
+
+        # Other files are still written in full
+        lines = (self.folder / "15/A.csv").read_text().split("\n")
+        self.assertEqual(len(lines), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import context
+import unittest
+from precise_patterns.doubly_linked_list import DoublyLinkedList
+
+
+class TestDoublyLinkedList(unittest.TestCase):
+    def setUp(self) -> None:
+        DoublyLinkedList._pool.clear()
+
+    def test_insert_and_remove(self):
+        dll = DoublyLinkedList()
+
+        node = dll.append(2)
+        dll.appendleft(1)
+        dll.insert_after(node, 4)
+        dll.insert_before(node, 3)
+
+        self.assertEqual(list(dll), [1, 3, 2, 4])
+        self.assertEqual(dll.values_list(), [1, 3, 2, 4])
+        self.assertEqual(list(reversed(dll)), [4, 2, 3, 1])
+
+        dll.remove_node(node)
+
+        self.assertEqual(list(dll), [1, 3, 4])
+        self.assertEqual(dll.pop(), 4)
+        self.assertEqual(dll.popleft(), 1)
+        self.assertEqual(len(dll), 1)
+        self.assertEqual(dll.values_list(), [3])
+
+        dll.clear()
+        self.assertEqual(dll.values_list(), [])
+
+    def test_iter_from_node(self):
+        dll = DoublyLinkedList()
+
+        for i in range(5):
+            node = dll.append(i)
+
+            if i == 2:
+                middle = node
+
+        self.assertEqual(list(dll.iter_from(middle)), [2, 3, 4])
+        self.assertEqual(list(dll.iter_from(middle, forward=False)), [2, 1, 0])
+        self.assertEqual(list(dll.iter_from(node, forward=False, limit=2)), [4, 3])
+        self.assertEqual(list(dll.iter_from(middle, limit=0)), [])
+
+    def test_removed_nodes_are_reused(self):
+        """Nodes released by remove_node are recycled on the next insert"""
+        dll = DoublyLinkedList()
+
+        node = dll.append(1)
+        dll.append(2)
+
+        self.assertEqual(dll.popleft(), 1)
+        self.assertEqual(DoublyLinkedList._pool, [node])
+        self.assertIsNone(node.value)
+
+        self.assertIs(dll.append(3), node)
+        self.assertEqual(DoublyLinkedList._pool, [])
+        self.assertEqual(list(dll), [2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
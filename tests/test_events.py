@@ -0,0 +1,67 @@
+import context
+import unittest
+from precise_patterns.events import EventBus
+
+
+class TestEventBus(unittest.TestCase):
+    def setUp(self) -> None:
+        self.bus = EventBus()
+        self.calls = []
+
+    def test_emit_calls_listeners_in_order(self):
+        self.bus.add_listener("candle.close", lambda c: self.calls.append(("a", c)))
+        self.bus.add_listener("candle.close", lambda c: self.calls.append(("b", c)))
+
+        self.assertTrue(self.bus.emit("candle.close", 1))
+        self.assertFalse(self.bus.emit("pivot.confirm", 1))
+        self.assertEqual(self.calls, [("a", 1), ("b", 1)])
+
+    def test_snapshot_updated_on_add_and_remove(self):
+        """Snapshots are immutable and replaced on every change"""
+        self.bus.add_listener("candle.close", self.calls.append)
+        before = self.bus.snapshot("candle.close")
+
+        self.bus.add_listener("candle.close", print)
+
+        self.assertEqual(before, (self.calls.append,))
+        self.assertEqual(self.bus.snapshot("candle.close"), (self.calls.append, print))
+
+        self.bus.remove_listener("candle.close", print)
+        self.assertEqual(self.bus.snapshot("candle.close"), (self.calls.append,))
+
+        self.bus.remove_all_listeners()
+        self.assertEqual(self.bus.snapshot("candle.close"), ())
+        self.assertFalse(self.bus.emit("candle.close", 1))
+
+    def test_once_listener_removed_after_emit(self):
+        self.bus.once("candle.close", self.calls.append)
+
+        self.bus.emit("candle.close", 1)
+        self.bus.emit("candle.close", 2)
+
+        self.assertEqual(self.calls, [1])
+        self.assertEqual(self.bus.snapshot("candle.close"), ())
+
+    def test_bound_emitter_sees_later_listeners(self):
+        """Listeners added or removed after binding are respected"""
+        emit = self.bus.bind_emitter("pivot.confirm")
+        emit(0)
+
+        self.bus.add_listener("pivot.confirm", self.calls.append)
+        emit(1)
+
+        self.bus.remove_all_listeners()
+        emit(2)
+
+        self.bus.add_listener("pivot.confirm", self.calls.append)
+        emit(3)
+
+        self.assertEqual(self.calls, [1, 3])
+
+    def test_error_event_raises_without_listener(self):
+        with self.assertRaises(ValueError):
+            self.bus.emit("error", ValueError("failed"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@ import helpers
 import unittest
 import unittest.mock
 from datetime import datetime, timedelta
+from precise_patterns.pivot_table import PivotTable
 from precise_patterns.pivots import MinMax
 
 
@@ -13,7 +14,7 @@ class TestMinMax(unittest.TestCase):
     @unittest.mock.patch("precise_patterns.pivots.event_bus")
     def test_major_pivot_high_detected(self, mock_bus: unittest.mock.Mock):
         """Test is a pivot high is detected"""
-        mock_bus.emit.side_effect = self.fake_bus.emit
+        mock_bus.bind_emitter.side_effect = self.fake_bus.bind_emitter
 
         pivot = MinMax(length=7, pivot_pos=3)
 
@@ -32,7 +33,7 @@ class TestMinMax(unittest.TestCase):
 
     @unittest.mock.patch("precise_patterns.pivots.event_bus")
     def test_major_pivot_low_detected(self, mock_bus):
-        mock_bus.emit.side_effect = self.fake_bus.emit
+        mock_bus.bind_emitter.side_effect = self.fake_bus.bind_emitter
 
         pivot = MinMax(length=7, pivot_pos=3)
 
@@ -48,6 +49,25 @@ class TestMinMax(unittest.TestCase):
         self.assertEqual(self.fake_bus.calls[0][0]["price"], 92)
         self.assertEqual(self.fake_bus.calls[0][0]["type"], "low")
 
+    @unittest.mock.patch("precise_patterns.pivots.event_bus")
+    def test_pivot_recorded_in_table(self, mock_bus):
+        """Confirmed pivots are appended to the table when provided"""
+        mock_bus.bind_emitter.side_effect = self.fake_bus.bind_emitter
+
+        table = PivotTable("FOO", "D")
+        pivot = MinMax(length=7, pivot_pos=3, table=table)
+
+        data = [[80, 70], [85, 70], [90, 70], [95, 70], [90, 70], [85, 70], [80, 70]]
+
+        dt = datetime(2025, 1, 1)
+
+        for high, low in data:
+            dt = dt + timedelta(1)
+            pivot.update(helpers.candle(high, low, dt))
+
+        self.assertEqual(len(table), 1)
+        self.assertEqual(table.view(0), self.fake_bus.calls[0][0])
+
     def test_minmax_buffer_behaviour(self):
         """
         With the max buffer length set to 7 and equivalent candles input,
@@ -146,6 +146,75 @@ class TestMinuteAggregator(unittest.TestCase):
         # Only 1-minute events expected → 3 calls, none for 3-min TF
         self.assertEqual(len(self.fake_bus.calls), 3)
 
+    @unittest.mock.patch(event_bus_module_path)
+    def test_on_batch_matches_on_candle_close(self, mock_bus: unittest.mock.Mock):
+        """
+        on_batch must emit the same events as calling on_candle_close per candle.
+        """
+        mock_bus.emit.side_effect = self.fake_bus.emit
+
+        base = self._ts()
+        candles = [
+            dict(
+                timestamp=base + timedelta(minutes=i),
+                open=100 + i,
+                high=101 + i,
+                low=99 - i,
+                close=100 + i,
+                volume=10,
+            )
+            for i in range(7)
+        ]
+
+        for c in candles:
+            self.agg.on_candle_close("AAPL", *c.values())
+
+        expected = self.fake_bus.calls
+        self.fake_bus.calls = []
+
+        agg = MinuteAggregator(self.start, self.end, filter_timeframes=[1, 3])
+        agg.on_batch("AAPL", iter(candles))
+
+        self.assertEqual(self.fake_bus.calls, expected)
+
+    @unittest.mock.patch(event_bus_module_path)
+    def test_on_rows_matches_on_batch(self, mock_bus: unittest.mock.Mock):
+        """
+        on_rows with tuples must emit the same events as on_batch with dicts.
+        """
+        mock_bus.emit.side_effect = self.fake_bus.emit
+
+        base = self._ts()
+        rows = [
+            (base + timedelta(minutes=i), 100 + i, 101 + i, 99 - i, 100 + i, 10)
+            for i in range(7)
+        ]
+        keys = ("timestamp", "open", "high", "low", "close", "volume")
+
+        self.agg.on_batch("AAPL", [dict(zip(keys, row)) for row in rows])
+
+        expected = self.fake_bus.calls
+        self.fake_bus.calls = []
+
+        agg = MinuteAggregator(self.start, self.end, filter_timeframes=[1, 3])
+        agg.on_rows("AAPL", iter(rows))
+
+        self.assertEqual(self.fake_bus.calls, expected)
+
+    @unittest.mock.patch(event_bus_module_path)
+    def test_bound_listeners_bypass_event_bus(self, mock_bus: unittest.mock.Mock):
+        """
+        With listeners bound, candles are passed directly to each listener.
+        """
+        received = []
+        self.agg.listeners = (received.append, received.append)
+
+        self.agg.on_candle_close("AAPL", self._ts(), 100, 101, 99, 100.5, 10)
+
+        mock_bus.emit.assert_not_called()
+        self.assertEqual(len(received), 2)
+        self.assertEqual(received[0]["timeframe"], 1)
+
 
 if __name__ == "__main__":
     unittest.main()
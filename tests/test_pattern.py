@@ -0,0 +1,247 @@
+import context
+import unittest
+from precise_patterns.base import registry
+from precise_patterns.base.pattern import BasePattern, Registry, register_pattern
+
+
+class PatternTestCase(unittest.TestCase):
+    def tearDown(self) -> None:
+        for name in [n for n in registry._REGISTER if n.startswith("Test")]:
+            registry._REGISTER.pop(name)
+            registry._INSTANCES.pop(name, None)
+
+
+class TestRegisterPattern(PatternTestCase):
+    def test_subclass_registered_on_creation(self):
+        class Pattern(BasePattern):
+            name = "TestPattern"
+
+            def on_pivot(self, pivot, candle):
+                pass
+
+        self.assertIs(registry._REGISTER["TestPattern"], Pattern)
+
+    def test_register_false_skips_registration(self):
+        class Pattern(BasePattern, register=False):
+            name = "TestPattern"
+
+            def on_pivot(self, pivot, candle):
+                pass
+
+        self.assertNotIn("TestPattern", registry._REGISTER)
+
+    def test_decorator_registers_class(self):
+        @register_pattern
+        class Pattern(BasePattern, register=False):
+            name = "TestPattern"
+
+            def on_pivot(self, pivot, candle):
+                pass
+
+        self.assertIs(registry._REGISTER["TestPattern"], Pattern)
+
+    def test_register_is_idempotent(self):
+        class Pattern(BasePattern):
+            name = "TestPattern"
+
+            def on_pivot(self, pivot, candle):
+                pass
+
+        self.assertIs(register_pattern(Pattern), Pattern)
+        self.assertIs(register_pattern(Pattern), Pattern)
+        self.assertIs(registry._REGISTER["TestPattern"], Pattern)
+
+    def test_subclass_of_registered_class_registered(self):
+        class Pattern(BasePattern):
+            name = "TestPattern"
+
+            def on_pivot(self, pivot, candle):
+                pass
+
+        class Child(Pattern):
+            name = "TestChild"
+
+        self.assertIs(registry._REGISTER["TestPattern"], Pattern)
+        self.assertIs(registry._REGISTER["TestChild"], Child)
+
+    def test_duplicate_name_raises(self):
+        class Pattern(BasePattern):
+            name = "TestPattern"
+
+            def on_pivot(self, pivot, candle):
+                pass
+
+        with self.assertRaises(ValueError):
+
+            class Child(Pattern):
+                pass
+
+        self.assertIs(registry._REGISTER["TestPattern"], Pattern)
+
+    def test_missing_name_raises(self):
+        for name in (None, "", 1):
+            with self.subTest(name=name), self.assertRaises(ValueError):
+                type(
+                    "Pattern",
+                    (BasePattern,),
+                    {"name": name, "on_pivot": lambda self, pivot, candle: None},
+                )
+
+
+class TestOnPivot(PatternTestCase):
+    def test_missing_on_pivot_raises(self):
+        with self.assertRaises(TypeError):
+
+            class Pattern(BasePattern):
+                name = "TestPattern"
+
+        self.assertNotIn("TestPattern", registry._REGISTER)
+
+    def test_unregistered_base_may_omit_on_pivot(self):
+        class Base(BasePattern, register=False):
+            name = "TestBase"
+
+        class Pattern(Base):
+            name = "TestPattern"
+
+            def on_pivot(self, pivot, candle):
+                pass
+
+        self.assertNotIn("TestBase", registry._REGISTER)
+        self.assertIs(registry._REGISTER["TestPattern"], Pattern)
+
+        with self.assertRaises(NotImplementedError):
+            Base().on_pivot(None, None)
+
+        with self.assertRaises(TypeError):
+            register_pattern(Base)
+
+        with self.assertRaises(TypeError):
+
+            class Other(Base):
+                name = "TestOther"
+
+        self.assertNotIn("TestOther", registry._REGISTER)
+
+
+class TestRegistry(PatternTestCase):
+    def setUp(self) -> None:
+        class Pattern(BasePattern):
+            name = "TestPattern"
+
+            def __init__(self, lookback=10) -> None:
+                self.lookback = lookback
+
+            def on_pivot(self, pivot, candle):
+                pass
+
+        self.Pattern = Pattern
+
+    def test_create_returns_shared_instance(self):
+        instance = registry.create("TestPattern", lookback=5)
+
+        self.assertIsInstance(instance, self.Pattern)
+        self.assertEqual(instance.lookback, 5)
+
+        # kwargs are ignored once created
+        self.assertIs(registry.create("TestPattern", lookback=20), instance)
+        self.assertIs(registry.get_instance("TestPattern"), instance)
+        self.assertIs(Registry.create("TestPattern"), instance)
+
+    def test_unknown_name_raises(self):
+        with self.assertRaises(KeyError):
+            registry.create("TestMissing")
+
+        with self.assertRaises(KeyError):
+            registry.get_instance("TestPattern")
+
+    def test_registered(self):
+        self.assertIs(registry.registered()["TestPattern"], self.Pattern)
+        self.assertIs(Registry.all(), registry.registered())
+
+
+class TestClassify(PatternTestCase):
+    def make_pattern(self):
+        calls = []
+
+        class Trend(BasePattern):
+            name = "TestTrend"
+
+            @staticmethod
+            def classify(window):
+                calls.append(window)
+                return window[-1] > window[0]
+
+            def on_pivot(self, pivot, candle):
+                pass
+
+        return Trend, calls
+
+    def test_classify_cached_per_window(self):
+        Trend, calls = self.make_pattern()
+
+        self.assertTrue(Trend.classify((1, 2)))
+        self.assertTrue(Trend.classify((1, 2)))
+        self.assertFalse(Trend.classify((2, 1)))
+        self.assertTrue(Trend().classify((1, 2)))
+
+        self.assertEqual(calls, [(1, 2), (2, 1)])
+
+    def test_cache_clear_forces_recompute(self):
+        Trend, calls = self.make_pattern()
+
+        Trend.classify((1, 2))
+        Trend.cache_clear()
+        Trend.classify((1, 2))
+
+        self.assertEqual(calls, [(1, 2), (1, 2)])
+
+    def test_classify_must_be_staticmethod(self):
+        with self.assertRaises(TypeError):
+
+            class Bad(BasePattern):
+                name = "TestBad"
+
+                def classify(self, window):
+                    return None
+
+                def on_pivot(self, pivot, candle):
+                    pass
+
+        self.assertNotIn("TestBad", registry._REGISTER)
+
+        with self.assertRaises(TypeError):
+
+            class BadBase(BasePattern, register=False):
+                def classify(self, window):
+                    return None
+
+    def test_unregistered_base_classify_cached(self):
+        """Subclasses inherit the cached classify of an unregistered base"""
+        calls = []
+
+        class Base(BasePattern, register=False):
+            @staticmethod
+            def classify(window):
+                calls.append(window)
+                return len(window)
+
+        class Pattern(Base):
+            name = "TestPattern"
+
+            def on_pivot(self, pivot, candle):
+                pass
+
+        self.assertEqual(Pattern.classify((1, 2)), 2)
+        self.assertEqual(Pattern.classify((1, 2)), 2)
+        self.assertEqual(Base.classify((1, 2)), 2)
+        self.assertEqual(calls, [(1, 2)])
+
+        Pattern.cache_clear()
+        Pattern.classify((1, 2))
+
+        self.assertEqual(calls, [(1, 2), (1, 2)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import context
+import helpers
+import unittest
+import unittest.mock
+from datetime import datetime, timedelta, timezone
+from precise_patterns import patterns
+from precise_patterns.base import registry
+from precise_patterns.base.pattern import BasePattern
+from precise_patterns.dtypes import Pivot
+from precise_patterns.ring_buffer import RingBuffer
+
+
+class TestVCP(unittest.TestCase):
+    def run_vcp(self, dt: datetime) -> patterns.VCP:
+        vcp = patterns.VCP(lookback=3)
+
+        for i, (price, type) in enumerate(
+            [(10, "high"), (5, "low"), (9, "high"), (6, "low")]
+        ):
+            vcp.on_pivot(
+                helpers.pivot(price, dt + timedelta(i), type, 1000 + price), None
+            )
+
+        return vcp
+
+    def test_pivot_backends_store_same_records(self):
+        """RingBuffer and deque fallback hold identical pivot records"""
+        ist = timezone(timedelta(hours=5, minutes=30))
+
+        for dt in (datetime(2025, 1, 1), datetime(2025, 1, 1, tzinfo=ist)):
+            with self.subTest(tzinfo=dt.tzinfo):
+                with unittest.mock.patch.object(patterns, "USE_RING_BUFFER", True):
+                    ring = self.run_vcp(dt)
+
+                with unittest.mock.patch.object(patterns, "USE_RING_BUFFER", False):
+                    fallback = self.run_vcp(dt)
+
+                self.assertIsInstance(ring.pivots, RingBuffer)
+                self.assertNotIsInstance(fallback.pivots, RingBuffer)
+
+                expected = [
+                    (dt + timedelta(1), 5, "low", 1005),
+                    (dt + timedelta(2), 9, "high", 1009),
+                    (dt + timedelta(3), 6, "low", 1006),
+                ]
+
+                self.assertEqual(list(ring.pivots), expected)
+                self.assertEqual(list(fallback.pivots), expected)
+                self.assertEqual(
+                    [ts.tzinfo for ts, _, _, _ in ring.pivots], [dt.tzinfo] * 3
+                )
+
+
+class TestPatternManager(unittest.TestCase):
+    def setUp(self) -> None:
+        class Other(BasePattern):
+            """A pattern that takes no options"""
+
+            name = "TestOther"
+
+            def on_pivot(self, pivot: Pivot, candle):
+                self.last = pivot
+
+        self.Other = Other
+
+    def tearDown(self) -> None:
+        registry._REGISTER.pop("TestOther", None)
+
+    def test_options_passed_to_named_pattern_only(self):
+        manager = patterns.PatternManager(options={"VCP": {"lookback": 2}})
+        dt = datetime(2025, 1, 1)
+
+        for i in range(3):
+            manager.on_pivot(helpers.pivot(i, dt + timedelta(i)), None)
+
+        instances = manager.buffer["FOO"]["D"]
+
+        self.assertEqual([p for _, p, _, _ in instances["VCP"].pivots], [1, 2])
+        self.assertIsInstance(instances["TestOther"], self.Other)
+        self.assertEqual(instances["TestOther"].last["price"], 2)
+
+    def test_options_override_shared_kwargs(self):
+        registry._REGISTER.pop("TestOther")
+        manager = patterns.PatternManager(lookback=5, options={"VCP": {"lookback": 2}})
+
+        for i in range(3):
+            manager.on_pivot(helpers.pivot(i, datetime(2025, 1, 1 + i)), None)
+
+        vcp = manager.buffer["FOO"]["D"]["VCP"]
+
+        self.assertEqual([p for _, p, _, _ in vcp.pivots], [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
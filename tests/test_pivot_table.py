@@ -0,0 +1,62 @@
+import context
+import unittest
+from datetime import datetime, timedelta, timezone
+from precise_patterns.dtypes import Pivot
+from precise_patterns.pivot_table import PivotTable
+
+
+class TestPivotTable(unittest.TestCase):
+    def test_append_and_view(self):
+        """Pivots round trip through the table"""
+        table = PivotTable("FOO", 15)
+        dt = datetime(2025, 1, 1, 9, 15)
+
+        pivots = [
+            Pivot(
+                symbol="FOO",
+                type="high" if i % 2 else "low",
+                timeframe=15,
+                timestamp=dt + timedelta(minutes=15 * i),
+                price=100 + i * 0.05,
+                volume=1000 + i,
+            )
+            for i in range(5)
+        ]
+
+        for i, pivot in enumerate(pivots):
+            self.assertEqual(table.append(pivot), i)
+
+        self.assertEqual(len(table), 5)
+        self.assertEqual([table.view(i) for i in range(5)], pivots)
+        self.assertEqual(table.view(-1), pivots[-1])
+
+        with self.assertRaises(IndexError):
+            table.view(5)
+
+    def test_timezone_aware_timestamps(self):
+        """Aware timestamps round trip with their tzinfo"""
+        ist = timezone(timedelta(hours=5, minutes=30))
+        dt = datetime(2025, 1, 1, 9, 15, tzinfo=ist)
+        table = PivotTable("FOO", "D")
+
+        for i in range(3):
+            table.append(
+                Pivot(
+                    symbol="FOO",
+                    type="low",
+                    timeframe="D",
+                    timestamp=dt + timedelta(i),
+                    price=100,
+                    volume=1000,
+                )
+            )
+
+        self.assertEqual(
+            [table.view(i)["timestamp"] for i in range(3)],
+            [dt, dt + timedelta(1), dt + timedelta(2)],
+        )
+        self.assertIs(table.view(0)["timestamp"].tzinfo, ist)
+
+
+if __name__ == "__main__":
+    unittest.main()
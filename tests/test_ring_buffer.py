@@ -0,0 +1,147 @@
+import context
+import helpers
+import unittest
+from datetime import datetime, timedelta, timezone
+from precise_patterns.ring_buffer import RingBuffer
+
+
+class TestRingBuffer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dt = datetime(2025, 1, 1, 9, 15)
+
+    def fill(self, buf: RingBuffer, prices):
+        return [
+            buf.append(helpers.pivot(p, self.dt + timedelta(i)))
+            for i, p in enumerate(prices)
+        ]
+
+    def test_append_and_iterate(self):
+        """Values round trip and are iterated in insertion order"""
+        buf = RingBuffer(4)
+
+        buf.append(helpers.pivot(95.5, self.dt, "high"))
+        buf.append(helpers.pivot(80.25, self.dt + timedelta(1), "low"))
+
+        self.assertEqual(len(buf), 2)
+        self.assertEqual(
+            list(buf),
+            [
+                (self.dt, 95.5, "high", 1000),
+                (self.dt + timedelta(1), 80.25, "low", 1000),
+            ],
+        )
+        self.assertEqual([p for _, p, _, _ in reversed(buf)], [80.25, 95.5])
+
+    def test_overwrites_oldest_when_full(self):
+        buf = RingBuffer(3)
+        handles = self.fill(buf, [1, 2, 3, 4, 5])
+
+        self.assertEqual(len(buf), 3)
+        self.assertEqual([p for _, p, _, _ in buf], [3, 4, 5])
+
+        # handle to an overwritten slot is stale
+        with self.assertRaises(KeyError):
+            buf.get(handles[0])
+
+        self.assertEqual(buf.get(handles[-1])[1], 5)
+
+    def test_pop_and_popleft(self):
+        buf = RingBuffer(3)
+        self.fill(buf, [1, 2, 3, 4])
+
+        self.assertEqual(buf.popleft()[1], 2)
+        self.assertEqual(buf.pop()[1], 4)
+        self.assertEqual(buf.pop()[1], 3)
+
+        with self.assertRaises(IndexError):
+            buf.pop()
+
+        with self.assertRaises(IndexError):
+            buf.popleft()
+
+    def test_remove_node(self):
+        """Removed slots are skipped and reclaimed at the buffer ends"""
+        buf = RingBuffer(4)
+        handles = self.fill(buf, [1, 2, 3, 4])
+
+        buf.remove_node(handles[1])
+
+        self.assertEqual(len(buf), 3)
+        self.assertEqual([p for _, p, _, _ in buf], [1, 3, 4])
+        self.assertEqual([p for _, p, _, _ in reversed(buf)], [4, 3, 1])
+
+        with self.assertRaises(KeyError):
+            buf.remove_node(handles[1])
+
+        self.assertEqual(buf.popleft()[1], 1)
+        self.assertEqual(buf.popleft()[1], 3)
+        self.assertEqual(len(buf), 1)
+
+        # Overwriting a removed slot keeps the length consistent
+        buf.remove_node(handles[3])
+        self.fill(buf, [5, 6, 7, 8, 9])
+
+        self.assertEqual(len(buf), 4)
+        self.assertEqual([p for _, p, _, _ in buf], [6, 7, 8, 9])
+
+    def test_removed_slots_compacted_when_full(self):
+        """Removed slots in the middle are reclaimed before overwriting"""
+        buf = RingBuffer(4)
+        handles = self.fill(buf, [0, 1, 2, 3])
+
+        buf.remove_node(handles[1])
+        buf.remove_node(handles[2])
+        handle = buf.append(helpers.pivot(4, self.dt + timedelta(4)))
+
+        self.assertEqual(len(buf), 3)
+        self.assertEqual([p for _, p, _, _ in buf], [0, 3, 4])
+        self.assertEqual([p for _, p, _, _ in reversed(buf)], [4, 3, 0])
+        self.assertEqual(buf.get(handles[0])[1], 0)
+        self.assertEqual(buf.get(handle)[1], 4)
+
+        # Handle to a moved pivot is stale
+        with self.assertRaises(KeyError):
+            buf.get(handles[3])
+
+        self.fill(buf, [5, 6])
+
+        self.assertEqual(len(buf), 4)
+        self.assertEqual([p for _, p, _, _ in buf], [3, 4, 5, 6])
+
+    def test_timezone_aware_timestamps(self):
+        """Aware timestamps round trip with their tzinfo"""
+        ist = timezone(timedelta(hours=5, minutes=30))
+        dt = datetime(2025, 1, 1, 9, 15, tzinfo=ist)
+
+        buf = RingBuffer(2)
+        buf.append(helpers.pivot(1, dt))
+        handle = buf.append(helpers.pivot(2, dt + timedelta(1)))
+
+        self.assertEqual([ts for ts, _, _, _ in buf], [dt, dt + timedelta(1)])
+        self.assertIs(buf.get(handle)[0].tzinfo, ist)
+
+        # An empty buffer takes the tzinfo of the next pivot
+        buf.clear()
+        buf.append(helpers.pivot(3, self.dt))
+
+        self.assertEqual(list(buf)[0][0], self.dt)
+
+    def test_clear(self):
+        buf = RingBuffer(2)
+        handles = self.fill(buf, [1, 2])
+
+        buf.clear()
+
+        self.assertEqual(len(buf), 0)
+        self.assertEqual(list(buf), [])
+
+        with self.assertRaises(KeyError):
+            buf.get(handles[0])
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            RingBuffer(0)
+
+
+if __name__ == "__main__":
+    unittest.main()